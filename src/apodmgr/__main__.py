@@ -1,20 +1,16 @@
 from sys import argv
 from typing import Callable, Optional
-from dataclasses import asdict
 from pathlib import Path
 from datetime import datetime
-import re
-import json
-from .apod import APOD
+from .apod import APOD, _dumps, _is_date_literal
 from .mgrcfg import ManagerConfiguration, default_manager_configuration_path
 from .set_bg import set_bg
 
 
 def int_or_none(string: str) -> Optional[int]:
-    try:
+    if string and (string.isdecimal() or (string[0] in '+-' and string[1:].isdecimal())):
         return int(string)
-    except ValueError:
-        return None
+    return None
 
 
 FETCH_HELP_MSG = f"""
@@ -31,36 +27,31 @@ def fetch(config: ManagerConfiguration):
         print(FETCH_HELP_MSG)
         return
     if len(argv) == 1:
-        if re.match(APOD.APOD_DATE_FORMAT_RE, argv[0]):
-            fetcher: Callable = lambda: config.fetch_single(argv[0])
-        elif (count := int_or_none(argv[0])) is not None:
-            fetcher: Callable = lambda: config.fetch_random(count)
-        elif argv[0] == 'today':
-            fetcher: Callable = lambda: config.fetch_single(None)
+        argument: str = argv.pop(0)
+        if argument == 'today':
+            apods: list[APOD] = [config.fetch_single(None)]
+        elif _is_date_literal(argument):
+            apods: list[APOD] = [config.fetch_single(argument)]
+        elif (count := int_or_none(argument)) is not None:
+            apods: list[APOD] = config.fetch_random(count)
         else:
             print(FETCH_HELP_MSG)
             return
-        argv.pop(0)
-    elif re.match(APOD.APOD_DATE_FORMAT_RE, argv[0]) and re.match(APOD.APOD_DATE_FORMAT_RE, argv[1]):
-        fetcher: Callable = lambda: config.fetch_range(argv[0], argv[1])
-        argv.pop(0)
-        argv.pop(0)
+    elif _is_date_literal(argv[0]) and _is_date_literal(argv[1]):
+        start_date: str = argv.pop(0)
+        end_date: str = argv.pop(0)
+        apods: list[APOD] = config.fetch_range(start_date, end_date)
     else:
         print(FETCH_HELP_MSG)
         return
 
-    apods: list[APOD] | APOD = fetcher()
-    if isinstance(apods, APOD):
-        apods: list[APOD] = [apods]
-
     for apod in apods:
         print(apod)
 
 
 def list_apods(config: ManagerConfiguration):
-    for apod_file_name in config.stored_apods():
-        apod = APOD.load_from(Path(config.apods_path) / apod_file_name)
-        print(apod)
+    for date, media_type, title in config.stored_apod_summaries():
+        print(f'{date} - {media_type} - {title}')
 
 
 DOWNLOAD_MEDIA_HELP_MSG = f"""
@@ -74,16 +65,22 @@ def download_media(config: ManagerConfiguration):
     if not argv:
         print(DOWNLOAD_MEDIA_HELP_MSG)
         return
-    date: str = argv.pop(0)
-    if date == 'today':
-        date: str = datetime.now().strftime(APOD.APOD_DATE_FORMATTER)
-    file_name: str = f'{date}.json'
-    if file_name not in config.stored_apods():
-        print(f'Haven\'t fetched {date} yet...')
-        return
-    apod = config.fetch_single(date)
-    config.save_media_for(apod)
-    print(Path(config.apods_media_path) / f'{apod.date}.{apod.media_extension}')
+    apods: list[APOD] = []
+    while argv:
+        date: str = argv.pop(0)
+        if date == 'today':
+            date: str = datetime.now().strftime(APOD.APOD_DATE_FORMATTER)
+        apod_file: Path = Path(config.apods_path) / f'{date}.json'
+        if not apod_file.is_file():
+            print(f'Haven\'t fetched {date} yet...')
+            continue
+        apods.append(APOD.load_from(apod_file))
+    if len(apods) == 1:
+        config.save_media_for(apods[0])
+    elif apods:
+        config.save_media_for_many(apods)
+    for apod in apods:
+        print(Path(config.apods_media_path) / f'{apod.date}.{apod.media_extension}')
 
 
 def set_background(config: ManagerConfiguration):
@@ -113,11 +110,23 @@ def mkcfg():
     if not path.parent.exists():
         path.parent.mkdir()
 
-    with open(str(path), 'w', encoding='utf-8') as fstream:
-        fstream.write(json.dumps(asdict(ManagerConfiguration('')), indent=4))
+    with open(str(path), 'wb') as fstream:
+        fstream.write(_dumps(ManagerConfiguration('')))
     print(f'Configuration created in {path}')
 
 
+_NO_CFG_COMMANDS: dict[str, Callable] = {
+    'mkcfg': mkcfg
+}
+
+_COMMANDS: dict[str, Callable[[ManagerConfiguration], None]] = {
+    'fetch': fetch,
+    'list': list_apods,
+    'download': download_media,
+    'set-bg': set_background
+}
+
+
 def main():
     argv.pop(0)
     if not argv:
@@ -125,36 +134,26 @@ def main():
         return
     command = argv.pop(0)
 
-    no_cfg_commands: dict[str, Callable] = {
-        'mkcfg': mkcfg
-    }
-
-    if command in no_cfg_commands:
-        no_cfg_commands[command]()
+    if command in _NO_CFG_COMMANDS:
+        _NO_CFG_COMMANDS[command]()
         return
 
-    if not default_manager_configuration_path().exists():
-        print(f'{default_manager_configuration_path()} not found')
+    configuration_path: Path = default_manager_configuration_path()
+    if not configuration_path.exists():
+        print(f'{configuration_path} not found')
         return
 
-    config: ManagerConfiguration = ManagerConfiguration.load_from(default_manager_configuration_path())
-
-    commands: dict[str, Callable[[ManagerConfiguration], None]] = {
-        'fetch': fetch,
-        'list': list_apods,
-        'download': download_media,
-        'set-bg': set_background
-    }
+    config: ManagerConfiguration = ManagerConfiguration.load_from(configuration_path)
 
-    if command not in commands:
+    if command not in _COMMANDS:
         print(f'Must specify a valid command:')
-        for command in no_cfg_commands:
+        for command in _NO_CFG_COMMANDS:
             print(command)
-        for command in commands:
+        for command in _COMMANDS:
             print(command)
         return
 
-    commands[command](config)
+    _COMMANDS[command](config)
 
 
 if __name__ == '__main__':
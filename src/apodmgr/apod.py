@@ -1,15 +1,73 @@
 from __future__ import annotations
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, is_dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 import json
-import re
-import requests
-from requests import Response, HTTPError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _loads(data: bytes | str) -> dict | list:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        obj = asdict(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _is_date_literal(value: str) -> bool:
+    return (
+        len(value) == 10
+        and value[4] == '-'
+        and value[7] == '-'
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
+def _normalize_date(date: Optional[str | datetime], name: str = 'date') -> str:
+    if date is None:
+        return datetime.now().strftime(APOD.APOD_DATE_FORMATTER)
+    if isinstance(date, str):
+        if _is_date_literal(date):
+            return date
+        raise ValueError(f'{name} must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
+    return date.strftime(APOD.APOD_DATE_FORMATTER)
+
+
+def _new_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+@cache
+def _session():
+    return _new_session()
+
+
+@cache
+def _api_session(api_key: str):
+    session = _new_session()
+    session.params = {'api_key': api_key}
+    return session
+
+
+@dataclass(slots=True)
 class APOD:
     API_ENDPOINT = 'https://api.nasa.gov/planetary/apod'
     APOD_DATE_FORMATTER = '%Y-%m-%d'
@@ -29,7 +87,7 @@ class APOD:
     service_version: Optional[str] = field(default=None)
 
     def _validate_data(self) -> None:
-        if not re.match(APOD.APOD_DATE_FORMAT_RE, self.date):
+        if not _is_date_literal(self.date):
             raise ValueError(f'date must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
         if not self.title:
             raise ValueError('APOD must have title')
@@ -54,34 +112,28 @@ class APOD:
 
     @property
     def datetime(self) -> datetime:
-        return datetime(year=int(self.date[0:4]), month=int(self.date[5:7]), day=int(self.date[8:10]))
+        return datetime.fromisoformat(self.date)
 
     @property
     def media_extension(self) -> str:
-        ext = self.best_url[self.best_url.rindex('.') + 1:]
-        if len(ext) > 4:
-            ext = 'jpg'
-        return ext
+        url_path: str = self.best_url.split('?', 1)[0].split('#', 1)[0]
+        ext: str = url_path.rpartition('.')[2]
+        return ext if 0 < len(ext) <= 4 else 'jpg'
 
     def __str__(self) -> str:
         return f'{self.date} - {self.media_type} - {self.title}'
 
     @staticmethod
     def load_from(file: Path) -> APOD:
-        with open(file, 'r', encoding='utf-8') as fstream:
-            return APOD(**json.loads(fstream.read()))
+        with open(file, 'rb') as fstream:
+            return APOD(**_loads(fstream.read()))
 
     @staticmethod
     def fetch_single(api_key: str, date: Optional[str | datetime]) -> APOD:
-        if date is None:
-            date: datetime = datetime.now()
-        if isinstance(date, datetime):
-            date: str = date.strftime(APOD.APOD_DATE_FORMATTER)
-        if not re.match(APOD.APOD_DATE_FORMAT_RE, date):
-            raise ValueError(f'date must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
+        from requests import Response, HTTPError
+        date: str = _normalize_date(date)
 
-        response: Response = requests.get(APOD.API_ENDPOINT, params={
-            'api_key': api_key,
+        response: Response = _api_session(api_key).get(APOD.API_ENDPOINT, params={
             'date': date
         })
 
@@ -92,11 +144,11 @@ class APOD:
 
     @staticmethod
     def fetch_random(api_key: str, count: int) -> list[APOD]:
+        from requests import Response, HTTPError
         if not (1 <= count <= 100):
             raise ValueError(f'`count` must be between (0, 100]')
 
-        response: Response = requests.get(APOD.API_ENDPOINT, params={
-            'api_key': api_key,
+        response: Response = _api_session(api_key).get(APOD.API_ENDPOINT, params={
             'count': count
         })
 
@@ -107,22 +159,11 @@ class APOD:
 
     @staticmethod
     def fetch_range(api_key: str, start_date: datetime | str, end_date: datetime | str) -> list[APOD]:
-        if start_date is None:
-            start_date: datetime = datetime.now()
-        if isinstance(start_date, datetime):
-            start_date: str = start_date.strftime(APOD.APOD_DATE_FORMATTER)
-        if not re.match(APOD.APOD_DATE_FORMAT_RE, start_date):
-            raise ValueError(f'start_date must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
-
-        if end_date is None:
-            end_date: datetime = datetime.now()
-        if isinstance(end_date, datetime):
-            end_date: str = end_date.strftime(APOD.APOD_DATE_FORMATTER)
-        if not re.match(APOD.APOD_DATE_FORMAT_RE, end_date):
-            raise ValueError(f'end_date must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
-
-        response: Response = requests.get(APOD.API_ENDPOINT, params={
-            'api_key': api_key,
+        from requests import Response, HTTPError
+        start_date: str = _normalize_date(start_date, 'start_date')
+        end_date: str = _normalize_date(end_date, 'end_date')
+
+        response: Response = _api_session(api_key).get(APOD.API_ENDPOINT, params={
             'start_date': start_date,
             'end_date': end_date
         })
@@ -1,30 +1,38 @@
 from __future__ import annotations
 from typing import Optional
-from os import listdir
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from datetime import datetime
-import json
 import os
-import re
-from .apod import APOD
-import requests
-from requests import Response, HTTPError
+import sqlite3
+from .apod import APOD, _loads, _dumps, _normalize_date, _session
 
 
+@cache
 def default_apods_dir() -> str:
     return str(Path.home() / Path('Pictures' if os.name == 'nt' else '') / 'apods')
 
 
+@cache
 def default_apods_media_dir() -> str:
     return str(Path.home() / Path('Pictures' if os.name == 'nt' else '') / 'apods' / 'images')
 
 
+@cache
 def default_manager_configuration_path() -> Path:
     return Path(default_apods_dir()) / "apodmgr.cfg.json"
 
 
-@dataclass
+@cache
+def _index_connection(apods_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(str(Path(apods_path) / 'index.sqlite'), check_same_thread=False)
+    connection.execute('CREATE TABLE IF NOT EXISTS apods(date TEXT PRIMARY KEY, media_type TEXT, title TEXT)')
+    return connection
+
+
+@dataclass(slots=True)
 class ManagerConfiguration:
     api_key: str
     apods_path: str = field(default_factory=default_apods_dir)
@@ -43,15 +51,19 @@ class ManagerConfiguration:
     def load_from(file: Path):
         if not file.is_file():
             raise FileNotFoundError(f'Cannot load {ManagerConfiguration} from {file}')
-        with open(file, 'r', encoding='utf-8') as file:
-            data: dict[str, str] = json.loads(file.read())
+        with open(file, 'rb') as file:
+            data: dict[str, str] = _loads(file.read())
         if 'api_key' not in data:
             raise ValueError(f'{ManagerConfiguration} file {file} does not contain required `api_key`')
         return ManagerConfiguration(**data)._validate_data()
 
     def store_apod(self, apod: APOD) -> APOD:
-        with open(Path(self.apods_path) / f'{apod.date}.json', 'w', encoding='utf-8') as file:
-            file.write(json.dumps(asdict(apod), indent=4))
+        with open(Path(self.apods_path) / f'{apod.date}.json', 'wb') as file:
+            file.write(_dumps(apod))
+        connection = _index_connection(self.apods_path)
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO apods VALUES(?, ?, ?)',
+                               (apod.date, apod.media_type, apod.title))
         return apod
 
     def store_apods(self, apods: list[APOD]) -> list[APOD]:
@@ -60,32 +72,43 @@ class ManagerConfiguration:
         return apods
 
     def stored_apods(self):
-        file_name_pattern: str = f'{APOD.APOD_DATE_FORMAT_RE}.json'
-        for file in listdir(self.apods_path):
-            if re.match(file_name_pattern, file):
-                yield file
+        with os.scandir(self.apods_path) as entries:
+            for entry in entries:
+                name: str = entry.name
+                if len(name) == 15 and name.endswith('.json') and name[4] == '-' and name[7] == '-':
+                    yield name
 
     def stored_media(self):
-        file_name_pattern: str = f'{APOD.APOD_DATE_FORMAT_RE}.(jpg|png|mp4)'
-        for file in listdir(self.apods_path):
-            if re.match(file_name_pattern, file):
-                yield file
+        with os.scandir(self.apods_path) as entries:
+            for entry in entries:
+                name: str = entry.name
+                if len(name) == 14 and name.endswith(('.jpg', '.png', '.mp4')) and name[4] == '-' and name[7] == '-':
+                    yield name
+
+    def stored_apod_summaries(self) -> list[tuple[str, str, str]]:
+        connection = _index_connection(self.apods_path)
+        stored: set[str] = {name[:10] for name in self.stored_apods()}
+        indexed: set[str] = {date for (date,) in connection.execute('SELECT date FROM apods')}
+        with connection:
+            if stale := indexed - stored:
+                connection.executemany('DELETE FROM apods WHERE date = ?', [(date,) for date in stale])
+            if missing := stored - indexed:
+                files = [Path(self.apods_path) / f'{date}.json' for date in missing]
+                with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+                    apods = list(executor.map(APOD.load_from, files))
+                connection.executemany('INSERT OR REPLACE INTO apods VALUES(?, ?, ?)',
+                                       [(apod.date, apod.media_type, apod.title) for apod in apods])
+        return connection.execute('SELECT date, media_type, title FROM apods ORDER BY date').fetchall()
 
     def stored_apod_file(self, date: str | datetime) -> str | None:
-        if isinstance(date, datetime):
-            date: str = date.strftime(APOD.APOD_DATE_FORMATTER)
-        if not re.match(APOD.APOD_DATE_FORMAT_RE, date):
-            raise ValueError(f'date must follow format {APOD.APOD_DATE_FORMAT}({APOD.APOD_DATE_FORMAT_RE})')
-        file_name: str = f'{date}.json'
-        for file in listdir(self.apods_path):
-            if file_name == file:
-                return file
-        return None
+        date: str = _normalize_date(date)
+        file: Path = Path(self.apods_path) / f'{date}.json'
+        return file.name if file.is_file() else None
 
     def fetch_single(self, date: Optional[str | datetime]) -> APOD:
         if date is not None and (file_name := self.stored_apod_file(date)) is not None:
-            with open(Path(self.apods_path) / file_name, 'r', encoding='utf-8') as fstream:
-                return APOD(**json.loads(fstream.read()))
+            with open(Path(self.apods_path) / file_name, 'rb') as fstream:
+                return APOD(**_loads(fstream.read()))
         return self.store_apod(APOD.fetch_single(self.api_key, date))
 
     def fetch_random(self, *args) -> list[APOD]:
@@ -98,16 +121,23 @@ class ManagerConfiguration:
         return Path(self.apods_media_path) / f'{apod.date}.{apod.media_extension}'
 
     def save_media_for(self, apod: APOD) -> None:
+        from requests import HTTPError
         file_name: str = f'{apod.date}.{apod.media_extension}'
-        for file in listdir(self.apods_media_path):
-            if file_name == file:
-                return
+        if (Path(self.apods_media_path) / file_name).exists():
+            return
 
         if not apod.is_image:
             raise TypeError(f'{apod} is not a savable image')
-        response: Response = requests.get(apod.best_url)
-        if not response.ok:
-            raise HTTPError(f'HTTP Error, status: {response.status_code}', response=response)
-
-        with open(Path(self.apods_media_path) / file_name, 'wb') as media:
-            media.write(response.content)
+        with _session().get(apod.best_url, stream=True) as response:
+            if not response.ok:
+                raise HTTPError(f'HTTP Error, status: {response.status_code}', response=response)
+
+            with open(Path(self.apods_media_path) / file_name, 'wb') as media:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    media.write(chunk)
+
+    def save_media_for_many(self, apods: list[APOD], workers: int = 8) -> None:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.save_media_for, apod) for apod in apods]
+            for future in futures:
+                future.result()